@@ -1,19 +0,0 @@
-#!/bin/bash
-
-# Required parameters:
-# @raycast.schemaVersion 1
-# @raycast.title Article CLI
-# @raycast.mode fullOutput
-
-# Optional parameters:
-# @raycast.icon 🤖
-# @raycast.argument1 { "type": "text", "placeholder": "Placeholder" }
-# @raycast.packageName test
-
-# Documentation:
-# @raycast.description Shows articles scraped from top fin and econ journals
-# @raycast.author andreas_brogger
-# @raycast.authorURL https://raycast.com/andreas_brogger
-
-echo "Hello World! Argument1 value: "$1""
-
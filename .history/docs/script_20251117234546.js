@@ -1,2 +0,0 @@
-// Simple utility script for the Finance Papers site
-console.log('Finance Papers Database loaded');
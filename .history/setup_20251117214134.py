@@ -1,43 +0,0 @@
-#!/usr/bin/env python3
-"""Setup script for finance-papers package"""
-from setuptools import setup, find_packages
-
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
-
-with open("requirements.txt", "r", encoding="utf-8") as fh:
-    requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
-
-setup(
-    name="finance-papers",
-    version="0.1.0",
-    author="Andreas Brogger",
-    description="A tool to scrape and analyze finance research papers",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    packages=find_packages(),
-    python_requires=">=3.8",
-    install_requires=requirements,
-    entry_points={
-        "console_scripts": [
-            "finance-papers=src.main:main",
-            "get-papers=src.getpapers_openalex:main",
-            "query-papers=src.query_openalex_db:main",
-            "get-wp=src.get_wp:main",
-            "query-wp=src.query_wp_db:main",
-            "extract-agendas=src.extract_research_agendas:main",
-        ],
-    },
-    classifiers=[
-        "Development Status :: 3 - Alpha",
-        "Intended Audience :: Science/Research",
-        "Topic :: Scientific/Engineering :: Information Analysis",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-        "Programming Language :: Python :: 3.13",
-    ],
-)
@@ -1,2 +0,0 @@
-"""Finance papers scraping and analysis package"""
-__version__ = "0.1.0"
@@ -1 +0,0 @@
-# python code to scrape page
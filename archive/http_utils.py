@@ -0,0 +1,44 @@
+# HTTP helpers shared by the scrapers
+from importlib import metadata
+
+import requests
+from urllib3.util.retry import Retry
+
+# Longest Retry-After wait (in seconds) honored before a retry; servers may ask for hours
+MAX_RETRY_AFTER = 30
+
+class CappedRetry(Retry):
+    """urllib3 Retry policy that waits at most MAX_RETRY_AFTER seconds for a Retry-After header"""
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+def _requests_cache_major_version():
+    """Major version of the installed requests-cache, or None if it isn't installed"""
+    # requests_cache 1.x no longer sets __version__, so ask the package metadata
+    try:
+        return int(metadata.version('requests-cache').split('.')[0])
+    except (metadata.PackageNotFoundError, ValueError):
+        return None
+
+def new_session(cache_name, **cache_options):
+    """Create an HTTP session, cached on disk under cache_name when requests-cache >= 1.0 is installed
+    
+    Older requests-cache releases can't drop a cached page by URL (see --refresh in
+    scrape-jf.py), so they get a plain session like a missing install does.
+    """
+    if (_requests_cache_major_version() or 0) >= 1:
+        from requests_cache import CachedSession
+        return CachedSession(cache_name, **cache_options)
+    return requests.Session()
+
+def header_charset(response):
+    """Get the charset advertised in the Content-Type header, or None"""
+    # requests falls back to ISO-8859-1 for text/* without a charset, so only
+    # trust response.encoding when the header actually names one
+    if 'charset=' in response.headers.get('Content-Type', '').lower():
+        return response.encoding
+    return None
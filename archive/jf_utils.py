@@ -0,0 +1,115 @@
+# Page parsing and CSV helpers shared by the Journal of Finance scrapers
+# (scrape-jf.py for issue pages, scrape-jf-forth.py for the forthcoming page)
+import csv
+import os
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+
+import http_utils
+
+# On-disk HTTP cache of both JF scrapers (relative to the working directory, next to
+# the CSVs in out/data); only used when requests-cache is installed, see http_utils.new_session
+HTTP_CACHE = 'out/cache/jf_http'
+
+# Only article-result-container subtrees are built when parsing a page. The
+# regex also matches elements that carry further classes next to it.
+CONTAINER_STRAINER = SoupStrainer(class_=re.compile(r'(?:^|\s)article-result-container(?:\s|$)'))
+
+# Article fields held by a container's first four paragraphs, in page order
+PARAGRAPH_FIELDS = ('title', 'date', 'authors', 'abstract')
+
+# Titles of placeholder articles that are never saved
+SKIP_TITLES = frozenset(["Manually Added Article Title"])
+
+# Links inside a div of the container
+DIV_LINK_SELECTOR = soupsieve.compile(':scope div a[href]')
+
+# DOI inside single quotes of a jofi javascript link, e.g. openWindow('10.1111/jofi.1')
+QUOTED_DOI_RE = re.compile(r"'([^']*)'")
+
+def parse_page(response):
+    """Parse the article containers of a fetched JF page"""
+    # Decoding with the advertised charset skips BeautifulSoup's encoding detection
+    return BeautifulSoup(response.content, 'lxml', parse_only=CONTAINER_STRAINER,
+                         from_encoding=http_utils.header_charset(response))
+
+def extract_article_containers(soup):
+    """Extract all article-result-container elements from the soup"""
+    if not soup:
+        print("No soup data available")
+        return []
+    
+    # Find all elements with class 'article-result-container'
+    article_containers = soup.find_all(class_='article-result-container')
+    print(f"Found {len(article_containers)} article containers")
+    
+    return article_containers
+
+def parse_article_container(container, volume, issue):
+    """Extract the data of one article container, or None if it should be skipped"""
+    # Find all paragraphs in the container; only the first four are read
+    paragraphs = container.find_all('p')
+    texts = [paragraphs[0].get_text(strip=True)] if paragraphs else []
+    
+    # Skip placeholder articles before reading any further paragraphs
+    if texts and texts[0] in SKIP_TITLES:
+        return None
+    texts.extend(paragraph.get_text(strip=True) for paragraph in paragraphs[1:4])
+    
+    # Extract data based on paragraph order (title, date, authors, abstract);
+    # containers with fewer paragraphs get only the leading fields
+    article_info = dict(zip(PARAGRAPH_FIELDS, texts))
+    
+    # Add volume and issue information
+    article_info['volume'] = volume
+    article_info['issue'] = issue
+    
+    # Find the div after the paragraphs for the article link
+    # Look for links inside the container's divs (each link once, in page order)
+    article_links = []
+    jofi_link = None
+    
+    for link in DIV_LINK_SELECTOR.select(container):
+        href = link.get('href', '')
+        # Look specifically for links containing 'jofi'
+        if 'jofi' in href.lower():
+            # Extract content inside single quotes from the jofi link
+            match = QUOTED_DOI_RE.search(href)
+            if match:
+                doi_id = match.group(1)  # Extract the content inside single quotes
+                jofi_link = f"https://onlinelibrary.wiley.com/doi/{doi_id}"  # Form complete URL
+            else:
+                jofi_link = href  # Fallback to full href if no quotes found
+        article_links.append(href)
+    
+    if jofi_link:
+        article_info['jofi_link'] = jofi_link
+    
+    if article_links:
+        article_info['all_links'] = article_links
+    
+    # Add debug info about structure
+    article_info['paragraph_count'] = len(paragraphs)
+    
+    return article_info
+
+def extract_article_data(article_containers, volume, issue):
+    """Extract specific data from article containers based on paragraph structure"""
+    articles = (parse_article_container(container, volume, issue) for container in article_containers)
+    return [article for article in articles if article is not None]
+
+def load_existing_jofi_links(csv_filepath):
+    """Read every jofi_link already saved in the CSV file (empty set if there is no file)"""
+    if not os.path.exists(csv_filepath):
+        return set()
+    
+    with open(csv_filepath, 'r', encoding='utf-8', newline='') as csvfile:
+        # Only the jofi_link column is needed, so read plain rows by index
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        if 'jofi_link' not in header:
+            return set()
+        idx = header.index('jofi_link')
+        return {row[idx] for row in reader if len(row) > idx and row[idx]}
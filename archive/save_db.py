@@ -3,33 +3,51 @@ import sqlite3
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
 
-def save_articles_to_db(articles_data, journal, volume, issue, db_filename='articles.db'):
-    """
-    Save articles to a unified SQLite database for both JF and AER
-    
-    Args:
-        articles_data: List of article dictionaries
-        journal: 'jf' or 'aer' to identify the journal
-        volume: Volume number or issue ID
-        issue: Issue number or 'forthcoming'
-        db_filename: Database filename (default: 'articles.db')
-    
-    Returns:
-        tuple: (number_of_new_articles, number_of_duplicates)
-    """
-    
-    # Create output directory structure (relative to project root)
-    output_dir = '../out/data'
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Full path to the database file
-    db_filepath = os.path.join(output_dir, db_filename)
-    
-    # Connect to SQLite database (creates file if it doesn't exist)
-    conn = sqlite3.connect(db_filepath)
-    cursor = conn.cursor()
+# Use orjson for the all_links JSON when it is installed (optional); both
+# produce plain JSON text, orjson just does it several times faster
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _json_dumps = json.dumps
+
+# Column order matches the row tuples built in save_articles_to_db. Kept as one
+# constant so every call hands sqlite3 the same SQL text and reuses its prepared statement.
+_INSERT_SQL = '''
+    INSERT OR IGNORE INTO articles (journal, title, date, authors, abstract, volume, issue, article_link, all_links, paragraph_count, scraped_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Database directory: out/data in the project root (the parent of this archive
+# directory), so the scrapers share one database whatever the working directory
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'out', 'data')
+
+@lru_cache(maxsize=None)
+def _db_path(db_filename):
+    """Create OUTPUT_DIR (once per process) and return the path of db_filename in it"""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    return os.path.join(OUTPUT_DIR, db_filename)
+
+def _connect(db_filepath):
+    """Open the articles database with write-friendly PRAGMAs"""
+    # Transactions are managed explicitly (BEGIN IMMEDIATE ... commit) by the callers
+    conn = sqlite3.connect(db_filepath, cached_statements=256, isolation_level=None)
     
+    # WAL + synchronous=NORMAL: one fsync per checkpoint instead of two per commit
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    # Keep temp tables and ~20 MB of hot pages in memory, read the file via mmap
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA cache_size=-20000')
+    conn.execute('PRAGMA mmap_size=268435456')
+    return conn
+
+def _init_schema(cursor):
+    """Create the unified articles table and its indexes if they don't exist"""
     # Create unified table if it doesn't exist
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS articles (
@@ -49,98 +67,153 @@ def save_articles_to_db(articles_data, journal, volume, issue, db_filename='arti
         )
     ''')
     
-    # Create indexes for faster duplicate checking and queries
+    # Unique indexes defining a duplicate: same link or same title within a journal.
+    # Empty values never count as duplicates. Being partial, they can't serve plain
+    # journal-only queries, which keep their own index.
+    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_journal_article_link ON articles(journal, article_link) WHERE article_link <> ''")
+    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_journal_title ON articles(journal, title) WHERE title <> ''")
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_journal ON articles(journal)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_article_link ON articles(article_link)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_title_journal ON articles(title, journal)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_volume_issue_journal ON articles(volume, issue, journal)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_scraped_at ON articles(scraped_at)')
     
-    new_articles = []
-    duplicate_count = 0
-    
-    for article in articles_data:
-        # Get the appropriate link field based on journal
-        if journal.lower() == 'jf':
-            article_link = article.get('jofi_link')
-        elif journal.lower() == 'aer':
-            article_link = article.get('aer_link')
-        elif journal.lower() == 'qje':
-            article_link = article.get('qje_link')
-        elif journal.lower() == 'rfs':
-            article_link = article.get('rfs_link')
-        else:
-            # Fallback: try to find any link field
-            article_link = (article.get('jofi_link') or 
-                          article.get('aer_link') or 
-                          article.get('qje_link') or 
-                          article.get('rfs_link') or 
-                          article.get('article_link'))
-        
-        title = article.get('title')
-        
-        # Check for duplicates based on link or title within the same journal
-        is_duplicate = False
-        
-        if article_link:
-            cursor.execute(
-                'SELECT id FROM articles WHERE article_link = ? AND journal = ?', 
-                (article_link, journal.lower())
-            )
-            if cursor.fetchone():
-                is_duplicate = True
-        
-        if not is_duplicate and title:
-            cursor.execute(
-                'SELECT id FROM articles WHERE title = ? AND journal = ?', 
-                (title, journal.lower())
-            )
-            if cursor.fetchone():
-                is_duplicate = True
-        
-        if is_duplicate:
-            duplicate_count += 1
-            print(f"DB Duplicate found: {article.get('title', 'Unknown Title')}")
-            continue
-        
-        # Prepare data for insertion
-        insert_data = {
-            'journal': journal.lower(),
-            'title': article.get('title', ''),
-            'date': article.get('date', ''),
-            'authors': article.get('authors', ''),
-            'abstract': article.get('abstract', ''),
-            'volume': str(volume),
-            'issue': str(issue),
-            'article_link': article_link,
-            'all_links': json.dumps(article.get('all_links', [])),
-            'paragraph_count': article.get('paragraph_count', 0) if journal.lower() == 'jf' else None,
-            'scraped_at': datetime.now().isoformat()
-        }
+    # Drop indexes made redundant by the unique ones above (older databases)
+    cursor.execute('DROP INDEX IF EXISTS idx_article_link')
+    cursor.execute('DROP INDEX IF EXISTS idx_title_journal')
+
+def _article_link(article, journal):
+    """Get the article link field that belongs to the journal"""
+    if journal == 'jf':
+        return article.get('jofi_link')
+    elif journal == 'aer':
+        return article.get('aer_link')
+    elif journal == 'qje':
+        return article.get('qje_link')
+    elif journal == 'rfs':
+        return article.get('rfs_link')
+    else:
+        # Fallback: try to find any link field
+        return (article.get('jofi_link') or 
+                article.get('aer_link') or 
+                article.get('qje_link') or 
+                article.get('rfs_link') or 
+                article.get('article_link'))
+
+def load_existing_articles(journal, db_filename='articles.db'):
+    """
+    Load the article links and titles already stored for a journal
+    
+    These are the two keys of the unique indexes, i.e. exactly what
+    save_articles_to_db treats as a duplicate.
+    
+    Returns:
+        tuple: (article_link set, title set), both empty if the database has no articles yet
+    """
+    db_filepath = _db_path(db_filename)
+    if not os.path.exists(db_filepath):
+        return set(), set()
+    
+    conn = _connect(db_filepath)
+    try:
+        # Both scans are served by the (journal, ...) unique indexes
+        links = {row[0] for row in conn.execute(
+            "SELECT article_link FROM articles WHERE journal = ? AND article_link <> ''", (journal.lower(),))}
+        titles = {row[0] for row in conn.execute(
+            "SELECT title FROM articles WHERE journal = ? AND title <> ''", (journal.lower(),))}
+    except sqlite3.OperationalError:
+        # No articles table yet
+        return set(), set()
+    finally:
+        conn.close()
+    
+    return links, titles
+
+def open_db(db_filename='articles.db'):
+    """
+    Open the articles database once for a multi-issue scrape
+    
+    The schema is set up here, so save_articles_to_db(..., conn=conn) can reuse
+    the connection for every issue. The caller closes it.
+    """
+    conn = _connect(_db_path(db_filename))
+    cursor = conn.cursor()
+    cursor.execute('BEGIN IMMEDIATE')
+    try:
+        _init_schema(cursor)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        conn.close()
+        raise
+    return conn
+
+def save_articles_to_db(articles_data, journal, volume, issue, db_filename='articles.db', conn=None):
+    """
+    Save articles to a unified SQLite database for both JF and AER
+    
+    Args:
+        articles_data: List of article dictionaries
+        journal: 'jf' or 'aer' to identify the journal
+        volume: Volume number or issue ID
+        issue: Issue number or 'forthcoming'
+        db_filename: Database filename (default: 'articles.db')
+        conn: Optional connection from open_db to reuse (left open)
+    
+    Returns:
+        tuple: (number_of_new_articles, number_of_duplicates)
+    """
+    
+    # Full path to the database file (the output directory is created on first use)
+    db_filepath = _db_path(db_filename)
+    
+    # Connect to SQLite database (creates file if it doesn't exist), unless
+    # the caller shares one that open_db already set up
+    own_conn = conn is None
+    if own_conn:
+        conn = _connect(db_filepath)
+    cursor = conn.cursor()
+    
+    # One timestamp per scrape run rather than per article
+    scraped_at = datetime.now().isoformat()
+    journal_key = journal.lower()
+    
+    rows = [
+        (
+            journal_key,
+            article.get('title', ''),
+            article.get('date', ''),
+            article.get('authors', ''),
+            article.get('abstract', ''),
+            str(volume),
+            str(issue),
+            _article_link(article, journal_key),
+            _json_dumps(article.get('all_links', [])),
+            article.get('paragraph_count', 0) if journal_key == 'jf' else None,
+            scraped_at,
+        )
+        for article in articles_data
+    ]
+    
+    # Take the write lock up front so schema setup and all inserts are a single transaction
+    cursor.execute('BEGIN IMMEDIATE')
+    try:
+        if own_conn:
+            _init_schema(cursor)
         
-        # Insert article into database
-        cursor.execute('''
-            INSERT INTO articles (journal, title, date, authors, abstract, volume, issue, article_link, all_links, paragraph_count, scraped_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            insert_data['journal'],
-            insert_data['title'],
-            insert_data['date'],
-            insert_data['authors'],
-            insert_data['abstract'],
-            insert_data['volume'],
-            insert_data['issue'],
-            insert_data['article_link'],
-            insert_data['all_links'],
-            insert_data['paragraph_count'],
-            insert_data['scraped_at']
-        ))
+        # The unique (journal, link) and (journal, title) indexes reject duplicates;
+        # OR IGNORE skips those rows instead of raising
+        changes_before = conn.total_changes
+        cursor.executemany(_INSERT_SQL, rows)
+        new_count = conn.total_changes - changes_before
         
-        new_articles.append(article)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        if own_conn:
+            conn.close()
     
-    # Commit changes and close connection
-    conn.commit()
-    conn.close()
+    duplicate_count = len(rows) - new_count
     
     # Display results
     journal_name = {
@@ -150,12 +223,12 @@ def save_articles_to_db(articles_data, journal, volume, issue, db_filename='arti
         'rfs': 'RFS'
     }.get(journal.lower(), journal.upper())
     
-    if new_articles:
-        print(f"\n💾 Saved {len(new_articles)} new {journal_name} articles to database {db_filepath}")
+    if new_count:
+        print(f"\n💾 Saved {new_count} new {journal_name} articles to database {db_filepath}")
     else:
         print(f"\n📝 No new {journal_name} articles to save to database {db_filepath}")
     
     if duplicate_count > 0:
         print(f"🔄 DB: Skipped {duplicate_count} duplicate {journal_name} articles")
     
-    return len(new_articles), duplicate_count
+    return new_count, duplicate_count
@@ -1,16 +1,32 @@
 # python code to scrape AER forthcoming articles
 import requests
 from bs4 import BeautifulSoup
+import soupsieve
 import csv
 import os
 import re
 from datetime import datetime
+from itertools import islice
 
 # Add current directory to path for importing save_db
 import sys
 sys.path.append(os.path.dirname(__file__))
 import save_db
 
+# Fallback line scanners: group(1) is a non-empty line without surrounding whitespace
+NONEMPTY_LINE_RE = re.compile(r'^[^\S\n]*(\S[^\n]*?)[^\S\n]*$', re.M)
+LONG_LINE_RE = re.compile(r'^[^\S\n]*(\S[^\n]{99,}\S)[^\S\n]*$', re.M)  # > 100 chars
+
+def _class_selector(tags, *words):
+    """Compile a selector for tags whose class contains any of the words (case-insensitive)"""
+    return soupsieve.compile(', '.join(f'{tag}[class*="{word}" i]' for tag in tags for word in words))
+
+# Field selectors, compiled once and reused for every container
+TITLE_SELECTOR = _class_selector(['h1', 'h2', 'h3'], 'title')
+AUTHORS_SELECTOR = _class_selector(['div', 'span', 'p'], 'author')
+DATE_SELECTOR = _class_selector(['div', 'span', 'p'], 'date', 'publish')
+ABSTRACT_SELECTOR = _class_selector(['div', 'p'], 'abstract', 'summary')
+
 def scrape_aer_forthcoming():
     """Scrape articles from AER forthcoming page"""
     url = "https://www.aeaweb.org/journals/aer/forthcoming"
@@ -18,7 +34,7 @@ def scrape_aer_forthcoming():
     
     response = requests.get(url)
     if response.status_code == 200:
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         return soup
     else:
         print(f"Failed to retrieve page: {response.status_code}")
@@ -30,21 +46,30 @@ def extract_article_containers(soup):
         print("No soup data available")
         return []
     
-    # For AER forthcoming articles, try multiple approaches
+    # For AER forthcoming articles, try multiple approaches. A single walk over
+    # the tree collects the candidates for all of them.
+    li_articles = []
+    class_articles = []
+    article_containers = []
+    for element in soup.find_all(True):
+        if 'article' in element.get('class', ()):
+            class_articles.append(element)
+            if element.name == 'li':
+                li_articles.append(element)
+        if element.name == 'article':
+            article_containers.append(element)
+    
     # Try list items with class="article" first (as mentioned by user)
-    li_articles = soup.find_all('li', class_='article')
     if li_articles:
         print(f"Found {len(li_articles)} <li class='article'> containers")
         return li_articles
     
     # Try any elements with class="article"
-    class_articles = soup.find_all(class_='article')
     if class_articles:
         print(f"Found {len(class_articles)} elements with class='article'")
         return class_articles
     
     # Find all article elements (fallback)
-    article_containers = soup.find_all('article')
     print(f"Found {len(article_containers)} <article> containers")
     
     return article_containers
@@ -55,9 +80,10 @@ def extract_article_data(article_containers):
     
     for container in article_containers:
         article_info = {}
+        full_text = None  # container.get_text(), pulled at most once for the fallbacks
         
         # Extract title - usually in h3 or h2 with class containing 'title'
-        title_element = container.find(['h1', 'h2', 'h3'], class_=re.compile(r'title', re.I))
+        title_element = TITLE_SELECTOR.select_one(container)
         if not title_element:
             # Fallback: look for any h1-h3 tag
             title_element = container.find(['h1', 'h2', 'h3'])
@@ -81,35 +107,35 @@ def extract_article_data(article_containers):
                 continue  # Skip if no title found
         
         # Extract authors - usually in a div or span with class containing 'author'
-        authors_element = container.find(['div', 'span', 'p'], class_=re.compile(r'author', re.I))
+        authors_element = AUTHORS_SELECTOR.select_one(container)
         if authors_element:
             article_info['authors'] = authors_element.get_text(strip=True)
         else:
             # Fallback: look for text patterns that might be authors
-            text_content = container.get_text()
-            lines = [line.strip() for line in text_content.split('\n') if line.strip()]
-            for line in lines[1:3]:  # Check lines after title
+            full_text = container.get_text()
+            for match in islice(NONEMPTY_LINE_RE.finditer(full_text), 1, 3):  # Check lines after title
+                line = match.group(1)
                 if ',' in line and len(line) < 200:  # Authors typically have commas
                     article_info['authors'] = line
                     break
         
         # Extract date/publication info
-        date_element = container.find(['div', 'span', 'p'], class_=re.compile(r'date|publish', re.I))
+        date_element = DATE_SELECTOR.select_one(container)
         if date_element:
             article_info['date'] = date_element.get_text(strip=True)
         
         # Extract abstract - usually in a div with class containing 'abstract' or 'summary'
-        abstract_element = container.find(['div', 'p'], class_=re.compile(r'abstract|summary', re.I))
+        abstract_element = ABSTRACT_SELECTOR.select_one(container)
         if abstract_element:
             article_info['abstract'] = abstract_element.get_text(strip=True)
         else:
             # Fallback: look for longer text content that might be an abstract
-            text_content = container.get_text()
-            lines = [line.strip() for line in text_content.split('\n') if line.strip()]
-            for line in lines:
-                if len(line) > 100:  # Abstracts are typically longer
-                    article_info['abstract'] = line
-                    break
+            # (reusing the text already pulled for the authors fallback)
+            if full_text is None:
+                full_text = container.get_text()
+            match = LONG_LINE_RE.search(full_text)  # Abstracts are typically longer
+            if match:
+                article_info['abstract'] = match.group(1)
         
         # Add volume and issue information for forthcoming articles
         article_info['volume'] = 'forthcoming'
@@ -236,8 +262,8 @@ def save_articles_to_csv(articles_data, csv_filename='articles_aer.csv'):
     
     return len(new_articles), duplicate_count
 
-if __name__ == "__main__":
-    # Scrape AER forthcoming articles
+def main():
+    """Scrape AER forthcoming articles, save them and display the new ones"""
     print("Scraping AER forthcoming articles...")
     
     soup = scrape_aer_forthcoming()
@@ -278,3 +304,6 @@ if __name__ == "__main__":
             print("No article containers found")
     else:
         print("Failed to scrape the forthcoming webpage")
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,90 @@
 # python code to scrape American Economic Review articles
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 import csv
+import importlib
 import os
 import re
 import sys
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Add current directory to path for importing save_db
+# Add current directory to path for importing save_db and http_utils
 sys.path.append(os.path.dirname(__file__))
 import save_db
+import http_utils
 
-def scrape_aer_issue(issue_id=810):
-    """Scrape articles from a specific AER issue"""
+# Shared HTTP session so consecutive issue requests reuse the kept-alive
+# connection to aeaweb.org instead of a new TCP+TLS handshake each time
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'finance-papers-scraper/1.0',
+    'Connection': 'keep-alive',
+})
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    # raise_on_status=False hands the last response back for the status check below
+    max_retries=http_utils.CappedRetry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                                       raise_on_status=False),
+))
+
+# Issue pages downloaded concurrently by scrape_multiple_issues
+MAX_FETCH_WORKERS = 8
+
+# Only <article> subtrees are built when parsing an issue page
+ARTICLE_STRAINER = SoupStrainer('article')
+
+# Class-name patterns for the article fields, compiled once
+TITLE_CLASS_RE = re.compile(r'title', re.I)
+AUTHOR_CLASS_RE = re.compile(r'author', re.I)
+DATE_CLASS_RE = re.compile(r'date|publish', re.I)
+ABSTRACT_CLASS_RE = re.compile(r'abstract|summary', re.I)
+
+# Field -> (tags that can hold it, class pattern), matched by find_field_elements
+HEADING_TAGS = ('h1', 'h2', 'h3')
+FIELD_PATTERNS = {
+    'title': (HEADING_TAGS, TITLE_CLASS_RE),
+    'authors': (('div', 'span', 'p'), AUTHOR_CLASS_RE),
+    'date': (('div', 'span', 'p'), DATE_CLASS_RE),
+    'abstract': (('div', 'p'), ABSTRACT_CLASS_RE),
+}
+FIELD_TAGS = sorted({tag for tags, _ in FIELD_PATTERNS.values() for tag in tags})
+
+# CSV output directory (relative to the working directory)
+OUTPUT_DIR = 'out/data'
+
+# Set SCRAPE_VERBOSE=1 to list every skipped duplicate, not just the count
+VERBOSE = os.environ.get('SCRAPE_VERBOSE') == '1'
+
+# Existing (aer_link set, title set) per CSV path, see load_existing_csv_articles
+_csv_existing_cache = {}
+
+def fetch_aer_issue(issue_id):
+    """Download the HTML of a specific AER issue page"""
     url = f"https://www.aeaweb.org/issues/{issue_id}"
     print(f"Scraping: {url}")
     
-    response = requests.get(url)
+    response = SESSION.get(url, timeout=(5, 30))
     if response.status_code == 200:
-        soup = BeautifulSoup(response.content, 'html.parser')
-        return soup
+        return response
     else:
         print(f"Failed to retrieve page: {response.status_code}")
         return None
 
+def parse_aer_issue(response):
+    """Parse the HTML of a fetched AER issue page"""
+    # Decoding with the advertised charset skips BeautifulSoup's encoding detection
+    return BeautifulSoup(response.content, 'lxml', parse_only=ARTICLE_STRAINER,
+                         from_encoding=http_utils.header_charset(response))
+
+def scrape_aer_issue(issue_id=810):
+    """Scrape articles from a specific AER issue"""
+    response = fetch_aer_issue(issue_id)
+    return parse_aer_issue(response) if response else None
+
 def extract_article_containers(soup):
     """Extract all article elements from the soup"""
     if not soup:
@@ -36,18 +97,34 @@ def extract_article_containers(soup):
     
     return article_containers
 
+def find_field_elements(container):
+    """Find the first element for each field with a single walk over the container
+    
+    Also records the first heading under 'heading' as the title fallback.
+    """
+    found = {}
+    for element in container.find_all(FIELD_TAGS):
+        classes = ' '.join(element.get('class', []))
+        for field, (tags, class_re) in FIELD_PATTERNS.items():
+            if field not in found and element.name in tags and class_re.search(classes):
+                found[field] = element
+        if 'heading' not in found and element.name in HEADING_TAGS:
+            found['heading'] = element
+    return found
+
 def extract_article_data(article_containers, volume='unknown', issue='unknown'):
     """Extract specific data from article containers"""
     articles_data = []
     
     for container in article_containers:
         article_info = {}
+        elements = find_field_elements(container)
         
         # Extract title - usually in h3 or h2 with class containing 'title'
-        title_element = container.find(['h1', 'h2', 'h3'], class_=re.compile(r'title', re.I))
+        title_element = elements.get('title')
         if not title_element:
             # Fallback: look for any h1-h3 tag
-            title_element = container.find(['h1', 'h2', 'h3'])
+            title_element = elements.get('heading')
         
         if title_element:
             title = title_element.get_text(strip=True)
@@ -59,17 +136,17 @@ def extract_article_data(article_containers, volume='unknown', issue='unknown'):
             continue  # Skip if no title found
         
         # Extract authors - usually in a div or span with class containing 'author'
-        authors_element = container.find(['div', 'span', 'p'], class_=re.compile(r'author', re.I))
+        authors_element = elements.get('authors')
         if authors_element:
             article_info['authors'] = authors_element.get_text(strip=True)
         
         # Extract date/publication info
-        date_element = container.find(['div', 'span', 'p'], class_=re.compile(r'date|publish', re.I))
+        date_element = elements.get('date')
         if date_element:
             article_info['date'] = date_element.get_text(strip=True)
         
         # Extract abstract - usually in a div with class containing 'abstract' or 'summary'
-        abstract_element = container.find(['div', 'p'], class_=re.compile(r'abstract|summary', re.I))
+        abstract_element = elements.get('abstract')
         if abstract_element:
             article_info['abstract'] = abstract_element.get_text(strip=True)
         
@@ -77,8 +154,8 @@ def extract_article_data(article_containers, volume='unknown', issue='unknown'):
         article_info['volume'] = volume
         article_info['issue'] = issue
         
-        # Find article links
-        article_links = []
+        # Find article links (dict keys keep the order and drop repeated hrefs)
+        article_links = {}
         aer_link = None
         
         # Look for links in the container
@@ -86,18 +163,20 @@ def extract_article_data(article_containers, volume='unknown', issue='unknown'):
         for link in links:
             href = link.get('href', '')
             # Look for AER-specific links (aeaweb.org domain)
-            if 'aeaweb.org' in href.lower() or href.startswith('/'):
-                if href.startswith('/'):
-                    aer_link = f"https://www.aeaweb.org{href}"
-                else:
-                    aer_link = href
-                article_links.append(href)
+            if href.startswith('/') or 'aeaweb.org' in href.lower():
+                article_links[href] = None
+                # The first AER link is the article page (later ones are PDFs etc.)
+                if aer_link is None:
+                    if href.startswith('/'):
+                        aer_link = f"https://www.aeaweb.org{href}"
+                    else:
+                        aer_link = href
         
         if aer_link:
             article_info['aer_link'] = aer_link
         
         if article_links:
-            article_info['all_links'] = article_links
+            article_info['all_links'] = list(article_links)
         
         # Add debug info
         article_info['container_class'] = container.get('class', [])
@@ -106,23 +185,20 @@ def extract_article_data(article_containers, volume='unknown', issue='unknown'):
     
     return articles_data
 
-def save_articles_to_csv(articles_data, volume, issue, csv_filename='articles_aer.csv'):
-    """Save articles to CSV file, checking for duplicates based on aer_link or title"""
-    fieldnames = ['title', 'date', 'authors', 'abstract', 'volume', 'issue', 'aer_link']
-    
-    # Create output directory structure
-    output_dir = 'out/data'
-    os.makedirs(output_dir, exist_ok=True)
+def load_existing_csv_articles(csv_filepath):
+    """Return the (aer_link set, title set) already saved in the CSV file
     
-    # Full path to the CSV file
-    csv_filepath = os.path.join(output_dir, csv_filename)
+    The sets are cached per path, so scraping several issues in one run reads
+    the CSV once; save_articles_to_csv adds newly written articles in place.
+    """
+    cached = _csv_existing_cache.get(csv_filepath)
+    if cached is not None:
+        return cached
     
-    # Check if CSV file exists and load existing articles
     existing_articles = set()
     existing_titles = set()
-    file_exists = os.path.exists(csv_filepath)
     
-    if file_exists:
+    if os.path.exists(csv_filepath):
         with open(csv_filepath, 'r', encoding='utf-8', newline='') as csvfile:
             reader = csv.DictReader(csvfile)
             for row in reader:
@@ -131,6 +207,26 @@ def save_articles_to_csv(articles_data, volume, issue, csv_filename='articles_ae
                 if row.get('title'):
                     existing_titles.add(row['title'].strip())
     
+    _csv_existing_cache[csv_filepath] = (existing_articles, existing_titles)
+    return existing_articles, existing_titles
+
+@lru_cache(maxsize=None)
+def output_path(filename):
+    """Create OUTPUT_DIR (once per process) and return the path of filename in it"""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    return os.path.join(OUTPUT_DIR, filename)
+
+def save_articles_to_csv(articles_data, volume, issue, csv_filename='articles_aer.csv'):
+    """Save articles to CSV file, checking for duplicates based on aer_link or title"""
+    fieldnames = ['title', 'date', 'authors', 'abstract', 'volume', 'issue', 'aer_link']
+    
+    # Full path to the CSV file (the output directory is created on first use)
+    csv_filepath = output_path(csv_filename)
+    
+    # Load existing articles (the CSV is only read on the first call per process)
+    file_exists = os.path.exists(csv_filepath)
+    existing_articles, existing_titles = load_existing_csv_articles(csv_filepath)
+    
     # Filter out articles that already exist
     new_articles = []
     duplicate_count = 0
@@ -148,7 +244,8 @@ def save_articles_to_csv(articles_data, volume, issue, csv_filename='articles_ae
         
         if is_duplicate:
             duplicate_count += 1
-            print(f"Duplicate found: {article.get('title', 'Unknown Title')}")
+            if VERBOSE:
+                print(f"Duplicate found: {article.get('title', 'Unknown Title')}")
         else:
             new_articles.append(article)
             if aer_link:
@@ -159,17 +256,17 @@ def save_articles_to_csv(articles_data, volume, issue, csv_filename='articles_ae
     # Write new articles to CSV
     if new_articles:
         mode = 'a' if file_exists else 'w'
-        with open(csv_filepath, mode, encoding='utf-8', newline='') as csvfile:
+        # Only write fields that are in fieldnames
+        filtered_articles = [{key: article.get(key, '') for key in fieldnames} for article in new_articles]
+        
+        with open(csv_filepath, mode, encoding='utf-8', newline='', buffering=1 << 16) as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             
             # Write header only if file is new
             if not file_exists:
                 writer.writeheader()
             
-            for article in new_articles:
-                # Only write fields that are in fieldnames
-                filtered_article = {key: article.get(key, '') for key in fieldnames}
-                writer.writerow(filtered_article)
+            writer.writerows(filtered_articles)
         
         print(f"\n✅ Saved {len(new_articles)} new articles to {csv_filepath}")
     else:
@@ -180,114 +277,122 @@ def save_articles_to_csv(articles_data, volume, issue, csv_filename='articles_ae
     
     return len(new_articles), duplicate_count
 
+def persist_articles(articles_data, volume, issue):
+    """Save articles to the CSV file and the database
+    
+    Returns:
+        tuple: (csv_new, csv_dupes, db_new, db_dupes)
+    """
+    csv_new, csv_dupes = save_articles_to_csv(articles_data, volume, issue)
+    db_new, db_dupes = save_db.save_articles_to_db(articles_data, 'aer', volume, issue)
+    return csv_new, csv_dupes, db_new, db_dupes
+
 def scrape_multiple_issues(issue_ids):
     """Scrape multiple AER issues"""
     all_articles = []
     total_new = 0
     total_duplicates = 0
+    issue_ids = list(issue_ids)
     
-    for issue_id in issue_ids:
-        print(f"\n{'='*50}")
-        print(f"Processing AER Issue {issue_id}")
-        print(f"{'='*50}")
+    # Download all issue pages concurrently; parsing and saving stay on this
+    # thread, in issue order, so CSV and SQLite writes remain sequential
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        pages = executor.map(fetch_aer_issue, issue_ids)
+        
+        for issue_id, response in zip(issue_ids, pages):
+            print(f"\n{'='*50}")
+            print(f"Processing AER Issue {issue_id}")
+            print(f"{'='*50}")
+            
+            soup = parse_aer_issue(response) if response is not None else None
         
-        # Scrape the issue page
-        soup = scrape_aer_issue(issue_id)
+            if soup:
+                # Extract article containers
+                article_containers = extract_article_containers(soup)
         
-        if soup:
-            # Extract article containers
-            article_containers = extract_article_containers(soup)
+                if article_containers:
+                    # Extract structured data from containers
+                    articles_data = extract_article_data(article_containers, volume=str(issue_id), issue='1')
+            
+                    # Save articles to CSV and database with duplicate checking
+                    csv_new, csv_dupes, db_new, db_dupes = persist_articles(articles_data, str(issue_id), '1')
             
-            if article_containers:
-                # Extract structured data from containers
-                articles_data = extract_article_data(article_containers, volume=str(issue_id), issue='1')
-                
-                # Save articles to CSV with duplicate checking
-                csv_new, csv_dupes = save_articles_to_csv(articles_data, str(issue_id), '1')
-                
-                # Save articles to database with duplicate checking
-                db_new, db_dupes = save_db.save_articles_to_db(articles_data, 'aer', str(issue_id), '1')
-                
-                all_articles.extend(articles_data)
-                total_new += csv_new
-                total_duplicates += csv_dupes
-                
-                print(f"Articles extracted from Issue {issue_id}: {len(articles_data)}")
-                print(f"📄 CSV: {csv_new} new, {csv_dupes} duplicates | 💾 DB: {db_new} new, {db_dupes} duplicates")
+                    all_articles.extend(articles_data)
+                    total_new += csv_new
+                    total_duplicates += csv_dupes
+            
+                    print(f"Articles extracted from Issue {issue_id}: {len(articles_data)}")
+                    print(f"📄 CSV: {csv_new} new, {csv_dupes} duplicates | 💾 DB: {db_new} new, {db_dupes} duplicates")
+                else:
+                    print(f"No article containers found for Issue {issue_id}")
             else:
-                print(f"No article containers found for Issue {issue_id}")
-        else:
-            print(f"Failed to scrape Issue {issue_id}")
+                print(f"Failed to scrape Issue {issue_id}")
     
     return all_articles, total_new, total_duplicates
 
+def run_issue(issue_id):
+    """Scrape a single AER issue, save it and display the new articles"""
+    print(f"Scraping American Economic Review Issue {issue_id}")
+    soup = scrape_aer_issue(issue_id)
+    
+    if not soup:
+        print("Failed to scrape the webpage")
+        return
+    
+    article_containers = extract_article_containers(soup)
+    if not article_containers:
+        print("No article containers found")
+        return
+    
+    articles_data = extract_article_data(article_containers, volume=str(issue_id), issue='1')
+    csv_new, csv_dupes, db_new, db_dupes = persist_articles(articles_data, str(issue_id), '1')
+    
+    print(f"📄 CSV: {csv_new} new, {csv_dupes} duplicates | 💾 DB: {db_new} new, {db_dupes} duplicates")
+    
+    # Display only new articles
+    if csv_new > 0:
+        print(f"\n🆕 NEW ARTICLES SAVED ({csv_new}):")
+        new_article_count = 0
+        for article in articles_data:
+            aer_link = article.get('aer_link')
+            # Check if this article was actually new (not a duplicate)
+            if aer_link:  # Only show articles that have valid links (the ones that get saved)
+                new_article_count += 1
+                if new_article_count <= csv_new:  # Only show the number of new articles
+                    print(f"\n=== New Article {new_article_count} ===")
+                    for key, value in article.items():
+                        if key not in ['all_links', 'container_class']:
+                            print(f"{key.capitalize()}: {value}")
+    else:
+        print(f"\n📋 No new articles to display (all {len(articles_data)} were duplicates)")
+
+def run_forthcoming():
+    """Run the AER forthcoming articles scraper"""
+    print("Running AER forthcoming articles scraper...")
+    
+    # Import the forthcoming scraper from this directory and run it in-process
+    try:
+        forth = importlib.import_module('scrape-aer-forth')
+    except ImportError as e:
+        print(f"Error importing AER forthcoming scraper: {e}")
+        print("Make sure scrape-aer-forth.py is in the same directory as this script")
+        return
+    
+    try:
+        forth.main()
+    except Exception as e:
+        print(f"Error running AER forthcoming scraper: {e}")
+
 if __name__ == "__main__":
     # Configuration: Get arguments from command line or use defaults
     
     # Check if command line arguments are provided
     if len(sys.argv) >= 2 and sys.argv[1].lower() in ['forth', 'forthcoming']:
-        # Run the forthcoming articles scraper
-        print("Running AER forthcoming articles scraper...")
-        
-        # Import and run the forthcoming scraper
-        try:
-            import subprocess
-            result = subprocess.run([
-                sys.executable, 
-                'src/scrape-aer-forth.py'
-            ], capture_output=True, text=True, cwd='.')
-            
-            # Print the output from the forthcoming scraper
-            if result.stdout:
-                print(result.stdout)
-            if result.stderr:
-                print("Errors:", result.stderr)
-            
-            print(f"AER forthcoming scraper completed with return code: {result.returncode}")
-            
-        except Exception as e:
-            print(f"Error running AER forthcoming scraper: {e}")
-            print("Make sure src/scrape-aer-forth.py exists in the correct location")
+        run_forthcoming()
             
     elif len(sys.argv) == 2:
         try:
             ISSUE_ID = int(sys.argv[1])
-            print(f"Using command line argument: Issue {ISSUE_ID}")
-            
-            # Scrape single issue
-            print(f"Scraping American Economic Review Issue {ISSUE_ID}")
-            soup = scrape_aer_issue(ISSUE_ID)
-            
-            if soup:
-                article_containers = extract_article_containers(soup)
-                if article_containers:
-                    articles_data = extract_article_data(article_containers, volume=str(ISSUE_ID), issue='1')
-                    csv_new, csv_dupes = save_articles_to_csv(articles_data, str(ISSUE_ID), '1')
-                    db_new, db_dupes = save_db.save_articles_to_db(articles_data, 'aer', str(ISSUE_ID), '1')
-                    
-                    print(f"📄 CSV: {csv_new} new, {csv_dupes} duplicates | 💾 DB: {db_new} new, {db_dupes} duplicates")
-                    
-                    # Display only new articles
-                    if csv_new > 0:
-                        print(f"\n🆕 NEW ARTICLES SAVED ({csv_new}):")
-                        new_article_count = 0
-                        for article in articles_data:
-                            aer_link = article.get('aer_link')
-                            # Check if this article was actually new (not a duplicate)
-                            if aer_link:  # Only show articles that have valid links (the ones that get saved)
-                                new_article_count += 1
-                                if new_article_count <= csv_new:  # Only show the number of new articles
-                                    print(f"\n=== New Article {new_article_count} ===")
-                                    for key, value in article.items():
-                                        if key not in ['all_links', 'container_class']:
-                                            print(f"{key.capitalize()}: {value}")
-                    else:
-                        print(f"\n📋 No new articles to display (all {len(articles_data)} were duplicates)")
-                else:
-                    print("No article containers found")
-            else:
-                print("Failed to scrape the webpage")
-                
         except ValueError:
             print("Error: Issue ID must be an integer or 'forthcoming'")
             print("Usage: python src/scrape-aer.py [issue_id]")
@@ -296,6 +401,9 @@ if __name__ == "__main__":
             print("Example: python src/scrape-aer.py forthcoming  (forthcoming articles)")
             print("Example: python src/scrape-aer.py              (default: issue 810)")
             sys.exit(1)
+        
+        print(f"Using command line argument: Issue {ISSUE_ID}")
+        run_issue(ISSUE_ID)
             
     elif len(sys.argv) == 1:
         # Default values if no arguments provided
@@ -303,40 +411,7 @@ if __name__ == "__main__":
         print(f"Using default value: Issue {ISSUE_ID}")
         print("To specify issue: python src/scrape-aer.py <issue_id>")
         print("To scrape forthcoming articles: python src/scrape-aer.py forthcoming")
-        
-        # Scrape single issue with defaults
-        print(f"Scraping American Economic Review Issue {ISSUE_ID}")
-        soup = scrape_aer_issue(ISSUE_ID)
-        
-        if soup:
-            article_containers = extract_article_containers(soup)
-            if article_containers:
-                articles_data = extract_article_data(article_containers, volume=str(ISSUE_ID), issue='1')
-                csv_new, csv_dupes = save_articles_to_csv(articles_data, str(ISSUE_ID), '1')
-                db_new, db_dupes = save_db.save_articles_to_db(articles_data, 'aer', str(ISSUE_ID), '1')
-                
-                print(f"📄 CSV: {csv_new} new, {csv_dupes} duplicates | 💾 DB: {db_new} new, {db_dupes} duplicates")
-                
-                # Display only new articles
-                if csv_new > 0:
-                    print(f"\n🆕 NEW ARTICLES SAVED ({csv_new}):")
-                    new_article_count = 0
-                    for article in articles_data:
-                        aer_link = article.get('aer_link')
-                        # Check if this article was actually new (not a duplicate)
-                        if aer_link:  # Only show articles that have valid links (the ones that get saved)
-                            new_article_count += 1
-                            if new_article_count <= csv_new:  # Only show the number of new articles
-                                print(f"\n=== New Article {new_article_count} ===")
-                                for key, value in article.items():
-                                    if key not in ['all_links', 'container_class']:
-                                        print(f"{key.capitalize()}: {value}")
-                else:
-                    print(f"\n📋 No new articles to display (all {len(articles_data)} were duplicates)")
-            else:
-                print("No article containers found")
-        else:
-            print("Failed to scrape the webpage")
+        run_issue(ISSUE_ID)
             
     else:
         print("Error: Invalid number of arguments")
@@ -1,114 +1,54 @@
 # python code to scrape page
-import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 import csv
 import os
-import re
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 
-# Add current directory to path for importing save_db
+# Add current directory to path for importing save_db, http_utils and jf_utils
 import sys
 sys.path.append(os.path.dirname(__file__))
 import save_db
+import http_utils
+import jf_utils
+
+@lru_cache(maxsize=None)
+def _session():
+    """HTTP session for the forthcoming page, created on first use
+    
+    With requests-cache installed (optional), responses are kept in the JF HTTP cache
+    for 6 hours and revalidated per Cache-Control, so repeated runs skip the download.
+    """
+    session = http_utils.new_session(jf_utils.HTTP_CACHE, expire_after=timedelta(hours=6), cache_control=True)
+    # requests already advertises gzip/deflate (and br when brotli is installed)
+    session.headers.update({'User-Agent': 'finance-papers-scraper/1.0'})
+    # Retry transient failures (rate limiting, gateway errors) with a short backoff
+    session.mount('https://', HTTPAdapter(
+        max_retries=http_utils.CappedRetry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                                           raise_on_status=False),
+    ))
+    return session
 
 # webpage link
 #url_jf = "https://afajof.org/forthcoming-articles/"  # Replace with the actual URL
 
 def scrape_jf():
     url = "https://afajof.org/forthcoming-articles/"  # Replace with the actual URL
-    response = requests.get(url)
+    response = _session().get(url, timeout=(5, 30))
     if response.status_code == 200:
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = jf_utils.parse_page(response)
         # Process the soup object as needed
         return soup
     else:
         print(f"Failed to retrieve page: {response.status_code}")
         return None
 
-def extract_article_containers(soup):
-    """Extract all article-result-container elements from the soup"""
-    if not soup:
-        print("No soup data available")
-        return []
+def save_articles_to_csv(articles_data, csv_filename='articles_jf.csv', existing=None):
+    """Save articles to CSV file, checking for duplicates based on jofi_link
     
-    # Find all elements with class 'article-result-container'
-    article_containers = soup.find_all(class_='article-result-container')
-    print(f"Found {len(article_containers)} article containers")
-    
-    return article_containers
-
-def extract_article_data(article_containers):
-    """Extract specific data from article containers based on paragraph structure"""
-    articles_data = []
-    
-    for container in article_containers:
-        article_info = {}
-        
-        # Find all paragraphs in the container
-        paragraphs = container.find_all('p')
-        
-        # Extract data based on paragraph order
-        if len(paragraphs) >= 1:
-            # First paragraph: title
-            title = paragraphs[0].get_text(strip=True)
-            # Skip articles with manually added titles
-            if title == "Manually Added Article Title":
-                continue
-            article_info['title'] = title
-        
-        if len(paragraphs) >= 2:
-            # Second paragraph: date
-            article_info['date'] = paragraphs[1].get_text(strip=True)
-        
-        if len(paragraphs) >= 3:
-            # Third paragraph: authors
-            article_info['authors'] = paragraphs[2].get_text(strip=True)
-        
-        if len(paragraphs) >= 4:
-            # Fourth paragraph: abstract
-            article_info['abstract'] = paragraphs[3].get_text(strip=True)
-        
-        # Add volume and issue information for forthcoming articles
-        article_info['volume'] = 'forthcoming'
-        article_info['issue'] = 'forthcoming'
-        
-        # Find the div after the paragraphs for the article link
-        # Look for divs that contain links
-        divs = container.find_all('div')
-        article_links = []
-        jofi_link = None
-        
-        for div in divs:
-            links = div.find_all('a', href=True)
-            if links:
-                for link in links:
-                    href = link.get('href', '')
-                    # Look specifically for links containing 'jofi'
-                    if 'jofi' in href.lower():
-                        # Extract content inside single quotes from the jofi link
-                        match = re.search(r"'([^']*)'", href)
-                        if match:
-                            doi_id = match.group(1)  # Extract the content inside single quotes
-                            jofi_link = f"https://onlinelibrary.wiley.com/doi/{doi_id}"  # Form complete URL
-                        else:
-                            jofi_link = href  # Fallback to full href if no quotes found
-                    article_links.append(href)
-        
-        if jofi_link:
-            article_info['jofi_link'] = jofi_link
-        
-        if article_links:
-            article_info['all_links'] = article_links
-        
-        # Add debug info about structure
-        article_info['paragraph_count'] = len(paragraphs)
-        
-        articles_data.append(article_info)
-    
-    return articles_data
-
-def save_articles_to_csv(articles_data, csv_filename='articles_jf.csv'):
-    """Save articles to CSV file, checking for duplicates based on jofi_link"""
+    existing: optional (link set, title set) from save_db.load_existing_articles.
+    When given, the database decides what is a duplicate and the CSV is not read.
+    """
     fieldnames = ['title', 'date', 'authors', 'abstract', 'volume', 'issue', 'jofi_link']
     
     # Create output directory structure
@@ -120,14 +60,13 @@ def save_articles_to_csv(articles_data, csv_filename='articles_jf.csv'):
     
     # Check if CSV file exists and load existing articles
     existing_articles = set()
+    existing_titles = set()
     file_exists = os.path.exists(csv_filepath)
     
-    if file_exists:
-        with open(csv_filepath, 'r', encoding='utf-8', newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                if row.get('jofi_link'):
-                    existing_articles.add(row['jofi_link'])
+    if existing is not None:
+        existing_articles, existing_titles = set(existing[0]), set(existing[1])
+    elif file_exists:
+        existing_articles = jf_utils.load_existing_jofi_links(csv_filepath)
     
     # Filter out articles that already exist
     new_articles = []
@@ -135,28 +74,28 @@ def save_articles_to_csv(articles_data, csv_filename='articles_jf.csv'):
     
     for article in articles_data:
         jofi_link = article.get('jofi_link')
-        if jofi_link and jofi_link in existing_articles:
+        if (jofi_link and jofi_link in existing_articles) or article.get('title') in existing_titles:
             duplicate_count += 1
             print(f"Duplicate found: {article.get('title', 'Unknown Title')}")
         else:
             new_articles.append(article)
             if jofi_link:
                 existing_articles.add(jofi_link)
+            if existing is not None and article.get('title'):
+                existing_titles.add(article['title'])
     
     # Write new articles to CSV
     if new_articles:
         mode = 'a' if file_exists else 'w'
-        with open(csv_filepath, mode, encoding='utf-8', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        with open(csv_filepath, mode, encoding='utf-8', newline='', buffering=1 << 16) as csvfile:
+            writer = csv.writer(csvfile)
             
             # Write header only if file is new
             if not file_exists:
-                writer.writeheader()
+                writer.writerow(fieldnames)
             
-            for article in new_articles:
-                # Only write fields that are in fieldnames
-                filtered_article = {key: article.get(key, '') for key in fieldnames}
-                writer.writerow(filtered_article)
+            # Only write fields that are in fieldnames, in column order
+            writer.writerows([article.get(key, '') for key in fieldnames] for article in new_articles)
         
         print(f"\n✅ Saved {len(new_articles)} new articles to {csv_filepath}")
     else:
@@ -166,21 +105,27 @@ def save_articles_to_csv(articles_data, csv_filename='articles_jf.csv'):
         print(f"🔄 Skipped {duplicate_count} duplicate articles")
     
     return len(new_articles), duplicate_count
-    
-if __name__ == "__main__":
+
+def main():
+    """Scrape JF forthcoming articles, save them and display the new ones"""
     # Scrape the webpage
     soup = scrape_jf()
     
     if soup:
         # Extract article containers
-        article_containers = extract_article_containers(soup)
+        article_containers = jf_utils.extract_article_containers(soup)
         
         if article_containers:
             # Extract structured data from containers
-            articles_data = extract_article_data(article_containers)
+            articles_data = jf_utils.extract_article_data(article_containers, 'forthcoming', 'forthcoming')
+            
+            # The database decides what is a duplicate once it holds JF articles;
+            # before that (e.g. first run next to an older CSV) the CSV is read instead
+            existing_links, existing_titles = save_db.load_existing_articles('jf')
+            existing = (existing_links, existing_titles) if existing_links or existing_titles else None
             
             # Save articles to CSV with duplicate checking
-            csv_new, csv_dupes = save_articles_to_csv(articles_data)
+            csv_new, csv_dupes = save_articles_to_csv(articles_data, existing=existing)
             
             # Save articles to database with duplicate checking
             db_new, db_dupes = save_db.save_articles_to_db(articles_data, 'jf', 'forthcoming', 'forthcoming')
@@ -207,3 +152,6 @@ if __name__ == "__main__":
             print("No article containers found")
     else:
         print("Failed to scrape the webpage")
+
+if __name__ == "__main__":
+    main()
@@ -1,132 +1,96 @@
 # python code to scrape Journal of Finance issue pages
-import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 import csv
+import importlib
 import os
-import re
 import sys
-from datetime import datetime
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
 
-# Add current directory to path for importing save_db
+# Add current directory to path for importing save_db, http_utils and jf_utils
 sys.path.append(os.path.dirname(__file__))
 import save_db
+import http_utils
+import jf_utils
 
-def scrape_jf_issue(volume, issue):
-    """Scrape articles from a specific Journal of Finance volume and issue"""
+# CSV output directory (relative to the working directory)
+OUTPUT_DIR = 'out/data'
+
+# Issue pages downloaded concurrently by scrape_multiple_issues. Kept small to
+# stay polite to afajof.org; override with --concurrency N.
+MAX_FETCH_WORKERS = 6
+
+# Set by --refresh: drop cached issue pages before fetching them
+REFRESH = False
+
+@lru_cache(maxsize=None)
+def get_session():
+    """Shared HTTP session, created on first use
+    
+    Issue requests reuse its kept-alive connections to afajof.org instead of a new
+    TCP+TLS handshake each time (requests already asks for gzip/deflate). With
+    requests-cache installed (optional), published issue pages are also cached on
+    disk for a week; pass --refresh to re-download.
+    """
+    session = http_utils.new_session(jf_utils.HTTP_CACHE, expire_after=timedelta(days=7),
+                                     allowable_codes=[200], stale_if_error=True)
+    session.headers.update({
+        'User-Agent': 'finance-papers-scraper/1.0',
+        'Connection': 'keep-alive',
+    })
+    session.mount('https://', HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=8,
+        # raise_on_status=False hands the last response back for the status check below
+        max_retries=http_utils.CappedRetry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504],
+                                           raise_on_status=False),
+    ))
+    return session
+
+def fetch_jf_issue(volume, issue):
+    """Download a specific Journal of Finance issue page"""
     url = f"https://afajof.org/issue/volume-{volume}-issue-{issue}/"
     print(f"Scraping: {url}")
     
-    response = requests.get(url)
+    session = get_session()
+    if REFRESH and hasattr(session, 'cache'):
+        session.cache.delete(urls=[url])
+    
+    response = session.get(url, timeout=(5, 30))
     if response.status_code == 200:
-        soup = BeautifulSoup(response.content, 'html.parser')
-        return soup
+        return response
     else:
         print(f"Failed to retrieve page: {response.status_code}")
         return None
 
-def extract_article_containers(soup):
-    """Extract all article-result-container elements from the soup"""
-    if not soup:
-        print("No soup data available")
-        return []
-    
-    # Find all elements with class 'article-result-container'
-    article_containers = soup.find_all(class_='article-result-container')
-    print(f"Found {len(article_containers)} article containers")
-    
-    return article_containers
+def parse_jf_issue(response):
+    """Parse the HTML of a fetched Journal of Finance issue page"""
+    return jf_utils.parse_page(response)
 
-def extract_article_data(article_containers, volume, issue):
-    """Extract specific data from article containers based on paragraph structure"""
-    articles_data = []
-    
-    for container in article_containers:
-        article_info = {}
-        
-        # Find all paragraphs in the container
-        paragraphs = container.find_all('p')
-        
-        # Extract data based on paragraph order
-        if len(paragraphs) >= 1:
-            # First paragraph: title
-            title = paragraphs[0].get_text(strip=True)
-            # Skip articles with manually added titles
-            if title == "Manually Added Article Title":
-                continue
-            article_info['title'] = title
-        
-        if len(paragraphs) >= 2:
-            # Second paragraph: date
-            article_info['date'] = paragraphs[1].get_text(strip=True)
-        
-        if len(paragraphs) >= 3:
-            # Third paragraph: authors
-            article_info['authors'] = paragraphs[2].get_text(strip=True)
-        
-        if len(paragraphs) >= 4:
-            # Fourth paragraph: abstract
-            article_info['abstract'] = paragraphs[3].get_text(strip=True)
-        
-        # Add volume and issue information
-        article_info['volume'] = volume
-        article_info['issue'] = issue
-        
-        # Find the div after the paragraphs for the article link
-        # Look for divs that contain links
-        divs = container.find_all('div')
-        article_links = []
-        jofi_link = None
-        
-        for div in divs:
-            links = div.find_all('a', href=True)
-            if links:
-                for link in links:
-                    href = link.get('href', '')
-                    # Look specifically for links containing 'jofi'
-                    if 'jofi' in href.lower():
-                        # Extract content inside single quotes from the jofi link
-                        match = re.search(r"'([^']*)'", href)
-                        if match:
-                            doi_id = match.group(1)  # Extract the content inside single quotes
-                            jofi_link = f"https://onlinelibrary.wiley.com/doi/{doi_id}"  # Form complete URL
-                        else:
-                            jofi_link = href  # Fallback to full href if no quotes found
-                    article_links.append(href)
-        
-        if jofi_link:
-            article_info['jofi_link'] = jofi_link
-        
-        if article_links:
-            article_info['all_links'] = article_links
-        
-        # Add debug info about structure
-        article_info['paragraph_count'] = len(paragraphs)
-        
-        articles_data.append(article_info)
-    
-    return articles_data
+def scrape_jf_issue(volume, issue):
+    """Scrape articles from a specific Journal of Finance volume and issue"""
+    response = fetch_jf_issue(volume, issue)
+    return parse_jf_issue(response) if response is not None else None
 
-def save_articles_to_csv(articles_data, volume, issue, csv_filename='articles_jf.csv'):
-    """Save articles to CSV file, checking for duplicates based on jofi_link"""
+def save_articles_to_csv(articles_data, volume, issue, csv_filename='articles_jf.csv', existing_links=None):
+    """Save articles to CSV file, checking for duplicates based on jofi_link
+    
+    existing_links: optional set from load_existing_jofi_links, updated in place
+    with the links written here, so a multi-issue run reads the CSV only once.
+    """
     fieldnames = ['title', 'date', 'authors', 'abstract', 'volume', 'issue', 'jofi_link']
     
     # Create output directory structure
-    output_dir = 'out/data'
-    os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
     
     # Full path to the CSV file
-    csv_filepath = os.path.join(output_dir, csv_filename)
+    csv_filepath = os.path.join(OUTPUT_DIR, csv_filename)
     
     # Check if CSV file exists and load existing articles
-    existing_articles = set()
     file_exists = os.path.exists(csv_filepath)
-    
-    if file_exists:
-        with open(csv_filepath, 'r', encoding='utf-8', newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                if row.get('jofi_link'):
-                    existing_articles.add(row['jofi_link'])
+    existing_articles = existing_links if existing_links is not None else jf_utils.load_existing_jofi_links(csv_filepath)
     
     # Filter out articles that already exist
     new_articles = []
@@ -145,17 +109,17 @@ def save_articles_to_csv(articles_data, volume, issue, csv_filename='articles_jf
     # Write new articles to CSV
     if new_articles:
         mode = 'a' if file_exists else 'w'
-        with open(csv_filepath, mode, encoding='utf-8', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        # Only write fields that are in fieldnames, in column order
+        rows = [[article.get(key, '') for key in fieldnames] for article in new_articles]
+        
+        with open(csv_filepath, mode, encoding='utf-8', newline='', buffering=1 << 16) as csvfile:
+            writer = csv.writer(csvfile)
             
             # Write header only if file is new
             if not file_exists:
-                writer.writeheader()
+                writer.writerow(fieldnames)
             
-            for article in new_articles:
-                # Only write fields that are in fieldnames
-                filtered_article = {key: article.get(key, '') for key in fieldnames}
-                writer.writerow(filtered_article)
+            writer.writerows(rows)
         
         print(f"\n✅ Saved {len(new_articles)} new articles to {csv_filepath}")
     else:
@@ -171,69 +135,94 @@ def scrape_multiple_issues(volume_issue_pairs):
     all_articles = []
     total_new = 0
     total_duplicates = 0
+    volume_issue_pairs = list(volume_issue_pairs)
     
-    for volume, issue in volume_issue_pairs:
-        print(f"\n{'='*50}")
-        print(f"Processing Volume {volume}, Issue {issue}")
-        print(f"{'='*50}")
-        
-        # Scrape the issue page
-        soup = scrape_jf_issue(volume, issue)
+    # Read the CSV's existing links once; save_articles_to_csv keeps the set current
+    existing_links = jf_utils.load_existing_jofi_links(os.path.join(OUTPUT_DIR, 'articles_jf.csv'))
+    
+    # Create the shared session before the fetch threads race to build it
+    get_session()
+    
+    # Download all issue pages concurrently; results are consumed in issue order as
+    # they complete, so each issue is parsed and saved (on this thread, keeping CSV
+    # and SQLite writes sequential) before a later download can fail the run.
+    # One database connection serves the whole run; each issue is still its own transaction.
+    with closing(save_db.open_db()) as db_conn, \
+         ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        pages = executor.map(lambda pair: fetch_jf_issue(*pair), volume_issue_pairs)
         
-        if soup:
-            # Extract article containers
-            article_containers = extract_article_containers(soup)
+        for (volume, issue), response in zip(volume_issue_pairs, pages):
+            print(f"\n{'='*50}")
+            print(f"Processing Volume {volume}, Issue {issue}")
+            print(f"{'='*50}")
             
-            if article_containers:
-                # Extract structured data from containers
-                articles_data = extract_article_data(article_containers, volume, issue)
-                
-                # Save articles to CSV with duplicate checking
-                csv_new, csv_dupes = save_articles_to_csv(articles_data, volume, issue)
-                
-                # Save articles to database with duplicate checking
-                db_new, db_dupes = save_db.save_articles_to_db(articles_data, 'jf', volume, issue)
-                
-                all_articles.extend(articles_data)
-                total_new += csv_new  # Use CSV count for total (they should be the same)
-                total_duplicates += csv_dupes
+            soup = parse_jf_issue(response) if response is not None else None
+            
+            if soup:
+                # Extract article containers
+                article_containers = jf_utils.extract_article_containers(soup)
                 
-                print(f"Articles extracted from Vol {volume} Issue {issue}: {len(articles_data)}")
-                print(f"📄 CSV: {csv_new} new, {csv_dupes} duplicates | 💾 DB: {db_new} new, {db_dupes} duplicates")
+                if article_containers:
+                    # Extract structured data from containers
+                    articles_data = jf_utils.extract_article_data(article_containers, volume, issue)
+                    
+                    # Save articles to CSV with duplicate checking
+                    csv_new, csv_dupes = save_articles_to_csv(articles_data, volume, issue, existing_links=existing_links)
+                    
+                    # Save articles to database with duplicate checking
+                    db_new, db_dupes = save_db.save_articles_to_db(articles_data, 'jf', volume, issue, conn=db_conn)
+                    
+                    all_articles.extend(articles_data)
+                    total_new += csv_new  # Use CSV count for total (they should be the same)
+                    total_duplicates += csv_dupes
+                    
+                    print(f"Articles extracted from Vol {volume} Issue {issue}: {len(articles_data)}")
+                    print(f"📄 CSV: {csv_new} new, {csv_dupes} duplicates | 💾 DB: {db_new} new, {db_dupes} duplicates")
+                else:
+                    print(f"No article containers found for Vol {volume} Issue {issue}")
             else:
-                print(f"No article containers found for Vol {volume} Issue {issue}")
-        else:
-            print(f"Failed to scrape Vol {volume} Issue {issue}")
+                print(f"Failed to scrape Vol {volume} Issue {issue}")
     
     return all_articles, total_new, total_duplicates
 
+def run_forthcoming():
+    """Run the JF forthcoming articles scraper"""
+    print("Running forthcoming articles scraper...")
+    
+    # Import the forthcoming scraper from this directory and run it in-process
+    try:
+        forth = importlib.import_module('scrape-jf-forth')
+    except ImportError as e:
+        print(f"Error importing forthcoming scraper: {e}")
+        print("Make sure scrape-jf-forth.py is in the same directory as this script")
+        return
+    
+    try:
+        forth.main()
+    except Exception as e:
+        print(f"Error running forthcoming scraper: {e}")
+
 if __name__ == "__main__":
     # Configuration: Get volume and issue from command line arguments or use defaults
     
+    # --refresh may appear anywhere; strip it before the positional arguments are read
+    if '--refresh' in sys.argv:
+        sys.argv.remove('--refresh')
+        REFRESH = True
+    
+    # --concurrency N sets how many issue pages are downloaded at once
+    if '--concurrency' in sys.argv:
+        idx = sys.argv.index('--concurrency')
+        value = sys.argv[idx + 1] if idx + 1 < len(sys.argv) else ''
+        if not value.isdigit() or int(value) < 1:
+            print("Error: --concurrency needs a positive integer, e.g. --concurrency 4")
+            sys.exit(1)
+        MAX_FETCH_WORKERS = int(value)
+        del sys.argv[idx:idx + 2]
+    
     # Check if command line arguments are provided
     if len(sys.argv) >= 2 and sys.argv[1].lower() in ['forth', 'forthcoming']:
-        # Run the forthcoming articles scraper
-        print("Running forthcoming articles scraper...")
-        
-        # Import and run the forthcoming scraper
-        try:
-            import subprocess
-            result = subprocess.run([
-                sys.executable, 
-                'src/scrape-jf-forth.py'
-            ], capture_output=True, text=True, cwd='.')
-            
-            # Print the output from the forthcoming scraper
-            if result.stdout:
-                print(result.stdout)
-            if result.stderr:
-                print("Errors:", result.stderr)
-            
-            print(f"Forthcoming scraper completed with return code: {result.returncode}")
-            
-        except Exception as e:
-            print(f"Error running forthcoming scraper: {e}")
-            print("Make sure src/scrape-jf-forth.py exists in the correct location")
+        run_forthcoming()
             
     elif len(sys.argv) == 3:
         try:
@@ -246,9 +235,9 @@ if __name__ == "__main__":
             soup = scrape_jf_issue(VOLUME, ISSUE)
             
             if soup:
-                article_containers = extract_article_containers(soup)
+                article_containers = jf_utils.extract_article_containers(soup)
                 if article_containers:
-                    articles_data = extract_article_data(article_containers, VOLUME, ISSUE)
+                    articles_data = jf_utils.extract_article_data(article_containers, VOLUME, ISSUE)
                     csv_new, csv_dupes = save_articles_to_csv(articles_data, VOLUME, ISSUE)
                     db_new, db_dupes = save_db.save_articles_to_db(articles_data, 'jf', VOLUME, ISSUE)
                     
@@ -366,9 +355,9 @@ if __name__ == "__main__":
         soup = scrape_jf_issue(VOLUME, ISSUE)
         
         if soup:
-            article_containers = extract_article_containers(soup)
+            article_containers = jf_utils.extract_article_containers(soup)
             if article_containers:
-                articles_data = extract_article_data(article_containers, VOLUME, ISSUE)
+                articles_data = jf_utils.extract_article_data(article_containers, VOLUME, ISSUE)
                 csv_new, csv_dupes = save_articles_to_csv(articles_data, VOLUME, ISSUE)
                 db_new, db_dupes = save_db.save_articles_to_db(articles_data, 'jf', VOLUME, ISSUE)
                 
@@ -406,4 +395,6 @@ if __name__ == "__main__":
         print("  python src/scrape-jf.py 78-80       (scrape Volumes 78, 79, 80 - all issues)")
         print("  python src/scrape-jf.py forthcoming (scrape forthcoming articles)")
         print("  python src/scrape-jf.py             (use defaults: Volume 80, Issue 4)")
+        print("  Add --refresh to re-download issue pages held in the HTTP cache")
+        print("  Add --concurrency N to download N issue pages at once (default 6)")
         sys.exit(1)
\ No newline at end of file
@@ -1,43 +1,60 @@
 # python code to test access to JFE (Journal of Financial Economics) volume pages
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import time
 import argparse
+import os
+import sys
+
+# Add current directory to path for importing http_utils
+sys.path.append(os.path.dirname(__file__))
+import http_utils
+
+# Use the specific Safari user agent provided
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.5 Safari/605.1.15'
+
+# Safari-specific headers, sent with every request
+HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'max-age=0',
+    'DNT': '1',
+}
+
+# One shared session so repeated requests to sciencedirect.com reuse the
+# kept-alive connection instead of a new TCP+TLS handshake each time
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+# Transient rate limits and server errors are retried with exponential backoff,
+# honoring Retry-After for at most http_utils.MAX_RETRY_AFTER seconds;
+# raise_on_status=False hands the last response back so a persistent 429 is
+# still reported below
+_RETRY = http_utils.CappedRetry(total=3, backoff_factor=1.0, status_forcelist=[429, 500, 502, 503, 504],
+                                respect_retry_after_header=True, raise_on_status=False)
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY))
+_SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY))
 
 def test_jfe_access(volume=172):
     """Test access to JFE volume page with specific Safari user agent"""
     url = f"https://www.sciencedirect.com/journal/journal-of-financial-economics/vol/{volume}/"
     print(f"Testing access to JFE Volume {volume}: {url}\n")
     
-    # Use the specific Safari user agent provided
-    user_agent = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.5 Safari/605.1.15'
-    
     print(f"🔍 Testing with Safari 18.5 on macOS")
     
-    # Build Safari-specific headers
-    headers = {
-        'User-Agent': user_agent,
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Cache-Control': 'max-age=0',
-        'DNT': '1',
-    }
-    
     try:
-        session = requests.Session()
-        session.headers.update(headers)
-        
-        response = session.get(url, timeout=30, allow_redirects=True)
+        response = _SESSION.get(url, timeout=30, allow_redirects=True)
         
         print(f"  Status: {response.status_code}")
         print(f"  Content Length: {len(response.text):,} chars")
         
         if response.status_code == 200:
             # Parse and analyze the content
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             title = soup.title.string if soup.title else "No title"
             
             print(f"  Page Title: {title[:80]}...")